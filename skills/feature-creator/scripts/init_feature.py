@@ -18,6 +18,7 @@ Examples:
     init_feature.py my-builder source
 """
 
+import json
 import sys
 from pathlib import Path
 
@@ -87,6 +88,31 @@ def format_json(data):
     return "\n".join(lines)
 
 
+def emit_feature_json(data):
+    """Emit devcontainer-feature.json for the fixed shape built by init_feature."""
+    option = data["options"]["version"]
+    lines = [
+        "{",
+        f'  "id": {json.dumps(data["id"])},',
+        f'  "version": {json.dumps(data["version"])},',
+        f'  "name": {json.dumps(data["name"])},',
+        f'  "description": {json.dumps(data["description"])},',
+        '  "options": {',
+        '    "version": {',
+        f'      "type": {json.dumps(option["type"])},',
+        f'      "default": {json.dumps(option["default"])},',
+        f'      "description": {json.dumps(option["description"])}',
+        "    }",
+    ]
+    if "installsAfter" in data:
+        lines.append("  },")
+        lines.append(f'  "installsAfter": {json.dumps(data["installsAfter"])}')
+    else:
+        lines.append("  }")
+    lines.append("}")
+    return "\n".join(lines)
+
+
 # Pattern-specific defaults
 INSTALL_TEMPLATES = {
     "npm": '''#!/bin/bash
@@ -355,7 +381,7 @@ def init_feature(feature_name: str, pattern: str):
         json_data["installsAfter"] = defaults["installsAfter"]
     
     json_path = feature_dir / "devcontainer-feature.json"
-    json_path.write_text(format_json(json_data) + "\n")
+    json_path.write_text(emit_feature_json(json_data) + "\n")
     print(f"✅ Created devcontainer-feature.json")
     
     # Create install.sh
@@ -10,7 +10,6 @@ import json
 import sys
 import os
 import asyncio
-import argparse
 from pathlib import Path
 
 try:
@@ -20,6 +19,26 @@ try:
 except ImportError:
     HAS_MCP = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def dump_json(data):
+    """Serialize data as indented JSON, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+def load_json(data):
+    """Parse JSON from str or bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def get_gitlab_token():
     """Get GitLab token from environment or prompt user."""
@@ -46,18 +65,24 @@ class MCPExecutor:
         self.session = None
         self._client_cm = None
         self._session_cm = None
-
-    async def connect(self):
-        """Connect to MCP server."""
-        token = get_gitlab_token()
-        env = dict(self.server_config.get("env", {}))
-        env["GITLAB_PERSONAL_ACCESS_TOKEN"] = token
+        self._token = None
+        self._tools_cache = None
         # Inherit PATH for npx
-        env["PATH"] = os.environ.get("PATH", "")
+        self._env_template = {
+            **server_config.get("env", {}),
+            "PATH": os.environ.get("PATH", ""),
+        }
         # Propagate GITLAB_API_URL from environment if set
         api_url = os.environ.get("GITLAB_API_URL")
         if api_url:
-            env["GITLAB_API_URL"] = api_url
+            self._env_template["GITLAB_API_URL"] = api_url
+
+    async def connect(self):
+        """Connect to MCP server."""
+        if self._token is None:
+            self._token = get_gitlab_token()
+        env = self._env_template.copy()
+        env["GITLAB_PERSONAL_ACCESS_TOKEN"] = self._token
 
         server_params = StdioServerParameters(
             command=self.server_config["command"],
@@ -71,26 +96,43 @@ class MCPExecutor:
         self.session = await self._session_cm.__aenter__()
         await self.session.initialize()
 
+    async def _fetch_tools(self):
+        """Fetch tools once per session and index them by name."""
+        if self._tools_cache is None:
+            if not self.session:
+                await self.connect()
+            response = await self.session.list_tools()
+            self._tools_cache = {tool.name: tool for tool in response.tools}
+        return self._tools_cache
+
     async def list_tools(self):
         """Get list of available tools."""
-        if not self.session:
-            await self.connect()
-        response = await self.session.list_tools()
-        return [{"name": tool.name, "description": tool.description} for tool in response.tools]
+        tools = await self._fetch_tools()
+        return [{"name": tool.name, "description": tool.description} for tool in tools.values()]
 
     async def describe_tool(self, tool_name: str):
         """Get detailed schema for a specific tool."""
-        if not self.session:
-            await self.connect()
-        response = await self.session.list_tools()
-        for tool in response.tools:
-            if tool.name == tool_name:
-                return {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": tool.inputSchema,
-                }
-        return None
+        tools = await self._fetch_tools()
+        tool = tools.get(tool_name)
+        if tool is None:
+            return None
+        return {
+            "name": tool.name,
+            "description": tool.description,
+            "inputSchema": tool.inputSchema,
+        }
+
+    async def describe_all(self):
+        """Get detailed schemas for every tool in a single request."""
+        tools = await self._fetch_tools()
+        return {
+            name: {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": tool.inputSchema,
+            }
+            for name, tool in tools.items()
+        }
 
     async def call_tool(self, tool_name: str, arguments: dict):
         """Execute a tool call."""
@@ -114,10 +156,18 @@ class MCPExecutor:
 
 
 async def main():
+    # Deferred so importing this module as a library skips argparse
+    import argparse
+
     parser = argparse.ArgumentParser(description="GitLab MCP Skill Executor")
-    parser.add_argument("--call", help="JSON tool call to execute")
+    parser.add_argument(
+        "--call", help="JSON tool call to execute (or @path to read it from a file)"
+    )
     parser.add_argument("--describe", help="Get tool schema by name")
     parser.add_argument("--list", action="store_true", help="List all tools")
+    parser.add_argument(
+        "--describe-all", action="store_true", help="Get schemas for all tools"
+    )
 
     args = parser.parse_args()
 
@@ -126,8 +176,7 @@ async def main():
         print(f"Error: Configuration file not found: {config_path}", file=sys.stderr)
         sys.exit(1)
 
-    with open(config_path) as f:
-        config = json.load(f)
+    config = load_json(config_path.read_bytes())
 
     if not HAS_MCP:
         print("Error: mcp package not installed", file=sys.stderr)
@@ -139,42 +188,49 @@ async def main():
     try:
         if args.list:
             tools = await executor.list_tools()
-            print(json.dumps(tools, indent=2))
+            print(dump_json(tools))
 
         elif args.describe:
             schema = await executor.describe_tool(args.describe)
             if schema:
-                print(json.dumps(schema, indent=2))
+                print(dump_json(schema))
             else:
                 print(f"Tool not found: {args.describe}", file=sys.stderr)
                 sys.exit(1)
 
+        elif args.describe_all:
+            schemas = await executor.describe_all()
+            print(dump_json(schemas))
+
         elif args.call:
-            call_data = json.loads(args.call)
+            if args.call.startswith("@"):
+                call_data = load_json(Path(args.call[1:]).read_bytes())
+            else:
+                call_data = load_json(args.call)
             result = await executor.call_tool(
                 call_data["tool"], call_data.get("arguments", {})
             )
             if isinstance(result, list):
-                for item in result:
-                    if hasattr(item, "text"):
-                        print(item.text)
-                    else:
-                        print(json.dumps(
-                            item.__dict__ if hasattr(item, "__dict__") else item,
-                            indent=2,
-                        ))
+                # Emit all items with a single write instead of one print per item
+                parts = [
+                    item.text if hasattr(item, "text")
+                    else dump_json(getattr(item, "__dict__", item))
+                    for item in result
+                ]
+                if parts:
+                    sys.stdout.write("\n".join(parts))
+                    sys.stdout.write("\n")
             else:
-                print(json.dumps(
-                    result.__dict__ if hasattr(result, "__dict__") else result,
-                    indent=2,
-                ))
+                print(dump_json(getattr(result, "__dict__", result)))
         else:
             parser.print_help()
 
     except Exception as e:
-        print(f"Error: {str(e)}", file=sys.stderr)
-        import traceback
-        traceback.print_exc(file=sys.stderr)
+        sys.stderr.write(f"Error: {e}\n")
+        # Full traceback only on request; formatting frames is costly in tight loops
+        if os.environ.get("MCP_DEBUG"):
+            import traceback
+            traceback.print_exc(file=sys.stderr)
         sys.exit(1)
     finally:
         await executor.close()